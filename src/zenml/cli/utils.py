@@ -21,6 +21,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     NoReturn,
@@ -35,14 +36,18 @@ from typing import (
 
 import click
 from rich import box, table
-from rich.markup import escape
 from rich.prompt import Confirm
 from rich.style import Style
 
 from zenml.config.global_config import GlobalConfiguration
 from zenml.console import console, zenml_style_defaults
 from zenml.constants import FILTERING_DATETIME_FORMAT, IS_DEBUG_ENV
-from zenml.enums import GenericFilterOps, StackComponentType, StoreType
+from zenml.enums import (
+    ExecutionStatus,
+    GenericFilterOps,
+    StackComponentType,
+    StoreType,
+)
 from zenml.logger import get_logger
 from zenml.models import BaseFilterModel
 from zenml.models.base_models import BaseResponseModel
@@ -54,8 +59,7 @@ from zenml.models.filter_models import (
 )
 from zenml.models.page_model import Page
 from zenml.secret import BaseSecretSchema
-from zenml.services import BaseService, ServiceState
-from zenml.zen_server.deploy import ServerDeployment
+from zenml.services import ServiceState
 
 logger = get_logger(__name__)
 
@@ -65,7 +69,6 @@ if TYPE_CHECKING:
     from rich.text import Text
 
     from zenml.client import Client
-    from zenml.enums import ExecutionStatus
     from zenml.integrations.integration import Integration
     from zenml.model_deployers import BaseModelDeployer
     from zenml.models import (
@@ -74,10 +77,25 @@ if TYPE_CHECKING:
         PipelineRunResponseModel,
         StackResponseModel,
     )
+    from zenml.services import BaseService
     from zenml.stack import Stack
+    from zenml.zen_server.deploy import ServerDeployment
 
 MAX_ARGUMENT_VALUE_SIZE = 10240
 
+EXECUTION_STATUS_EMOJIS: Dict[ExecutionStatus, str] = {
+    ExecutionStatus.FAILED: ":x:",
+    ExecutionStatus.RUNNING: ":gear:",
+    ExecutionStatus.COMPLETED: ":white_check_mark:",
+    ExecutionStatus.CACHED: ":package:",
+}
+
+SERVICE_STATE_EMOJIS: Dict[ServiceState, str] = {
+    ServiceState.ACTIVE: ":white_check_mark:",
+    ServiceState.INACTIVE: ":pause_button:",
+    ServiceState.ERROR: ":heavy_exclamation_mark:",
+}
+
 
 def title(text: str) -> None:
     """Echo a title formatted string on the CLI.
@@ -163,7 +181,13 @@ def print_table(obj: List[Dict[str, Any]], **columns: table.Column) -> None:
         obj: A List containing dictionaries.
         columns: Optional column configurations to be used in the table.
     """
-    column_keys = {key: None for dict_ in obj for key in dict_}
+    if obj and all(dict_.keys() == obj[0].keys() for dict_ in obj):
+        # Fast path for the common case where all rows share the same keys
+        column_keys = list(obj[0])
+    else:
+        column_keys = list(
+            dict.fromkeys(key for dict_ in obj for key in dict_)
+        )
     column_names = [columns.get(key, key.upper()) for key in column_keys]
     rich_table = table.Table(box=box.HEAVY_EDGE, show_lines=True)
     for col_name in column_names:
@@ -174,20 +198,15 @@ def print_table(obj: List[Dict[str, Any]], **columns: table.Column) -> None:
                 str(col_name.header).upper(), overflow="fold"
             )
     for dict_ in obj:
-        values = []
-        for key in column_keys:
-            if key is None:
-                values.append(None)
-            else:
-                value = str(dict_.get(key) or " ")
-                # escape text when square brackets are used
-                if "[" in value:
-                    value = escape(value)
-                values.append(value)
-        rich_table.add_row(*values)
+        rich_table.add_row(
+            *(str(dict_.get(key) or " ") for key in column_keys)
+        )
     if len(rich_table.columns) > 1:
         rich_table.columns[0].justify = "center"
-    console.print(rich_table)
+    # Cell values are plain data, not markup: skipping the markup parser keeps
+    # square brackets intact without having to escape each cell. Emoji codes
+    # are still resolved as the emoji replacement is independent of markup.
+    console.print(rich_table, markup=False)
 
 
 T = TypeVar("T", bound=BaseResponseModel)
@@ -224,8 +243,16 @@ def print_pydantic_models(
         """
         # Explicitly defined columns take precedence over exclude columns
         if not columns:
+            # Only the attribute names are needed here, so read them from the
+            # instance `__dict__` (which also holds extra attributes) instead
+            # of serializing the entire, possibly nested, model via `.dict()`.
+            # Unlike `.dict()`, `__dict__` still contains fields declared with
+            # `Field(exclude=True)` (e.g. passwords), so skip those explicitly.
+            excluded_fields = model.__exclude_fields__ or {}
             include_columns = [
-                k for k in model.dict().keys() if k not in exclude_columns  # type: ignore[operator]
+                k
+                for k in model.__dict__
+                if k not in excluded_fields and k not in exclude_columns  # type: ignore[operator]
             ]
         else:
             include_columns = columns
@@ -302,6 +329,33 @@ def format_integration_list(
     return list_of_dicts
 
 
+def _print_property_table(
+    properties: Iterable[Tuple[str, Any]],
+    property_column: str,
+    title: Optional[str] = None,
+) -> None:
+    """Prints a table of property names and their values.
+
+    Property names are capitalized before they are added to the table.
+
+    Args:
+        properties: The (name, value) pairs to print, one row each.
+        property_column: Header of the property name column.
+        title: Optional title of the table.
+    """
+    rich_table = table.Table(
+        box=box.HEAVY_EDGE,
+        title=title,
+        show_lines=True,
+    )
+    rich_table.add_column(property_column, overflow="fold")
+    rich_table.add_column("VALUE", overflow="fold")
+    for name, value in properties:
+        rich_table.add_row(str(name).upper(), str(value))
+
+    console.print(rich_table)
+
+
 def print_stack_configuration(
     stack: "StackResponseModel", active: bool
 ) -> None:
@@ -323,13 +377,8 @@ def print_stack_configuration(
     rich_table.add_column("COMPONENT_TYPE", overflow="fold")
     rich_table.add_column("COMPONENT_NAME", overflow="fold")
     for component_type, components in stack.components.items():
-        rich_table.add_row(component_type, components[0].name)
+        rich_table.add_row(component_type.upper(), components[0].name)
 
-    # capitalize entries in first column
-    rich_table.columns[0]._cells = [
-        component.upper()  # type: ignore[union-attr]
-        for component in rich_table.columns[0]._cells
-    ]
     console.print(rich_table)
     declare(
         f"Stack '{stack.name}' with id '{stack.id}' is "
@@ -389,29 +438,12 @@ def print_stack_component_configuration(
 
     if active_status:
         title_ += " (ACTIVE)"
-    rich_table = table.Table(
-        box=box.HEAVY_EDGE,
+
+    _print_property_table(
+        properties=component.configuration.items(),
+        property_column="COMPONENT_PROPERTY",
         title=title_,
-        show_lines=True,
     )
-    rich_table.add_column("COMPONENT_PROPERTY")
-    rich_table.add_column("VALUE", overflow="fold")
-
-    component_dict = component.dict()
-    component_dict.pop("configuration")
-    component_dict.update(component.configuration)
-
-    items = component.configuration.items()
-    for item in items:
-        elements = []
-        for idx, elem in enumerate(item):
-            if idx == 0:
-                elements.append(f"{elem.upper()}")
-            else:
-                elements.append(str(elem))
-        rich_table.add_row(*elements)
-
-    console.print(rich_table)
 
 
 def print_active_config() -> None:
@@ -592,9 +624,13 @@ def parse_unknown_component_attributes(args: List[str]) -> List[str]:
         "--custom_attribute"
     )
 
-    assert all(a.startswith("--") for a in args), warning_message
-    p_args = [a.lstrip("-") for a in args]
-    assert all(v.isidentifier() for v in p_args), warning_message
+    p_args = []
+    for a in args:
+        # Only strip the exact `--` prefix, `lstrip` would also accept
+        # attributes with any number of leading dashes
+        attribute = a[2:]
+        assert a.startswith("--") and attribute.isidentifier(), warning_message
+        p_args.append(attribute)
     return p_args
 
 
@@ -610,6 +646,7 @@ def install_packages(packages: List[str]) -> None:
         command += [
             "-qqq",
             "--no-warn-conflicts",
+            "--disable-pip-version-check",
         ]
 
     subprocess.check_call(command)
@@ -674,14 +711,13 @@ def print_list_items(list_items: List[str], column_title: str) -> None:
         show_lines=True,
     )
     rich_table.add_column(column_title.upper(), overflow="fold")
-    list_items.sort()
-    for item in list_items:
+    for item in sorted(list_items):
         rich_table.add_row(item)
 
     console.print(rich_table)
 
 
-def get_service_state_emoji(state: "ServiceState") -> str:
+def get_service_state_emoji(state: ServiceState) -> str:
     """Get the rich emoji representing the operational state of a Service.
 
     Args:
@@ -690,15 +726,7 @@ def get_service_state_emoji(state: "ServiceState") -> str:
     Returns:
         String representing the emoji.
     """
-    from zenml.services.service_status import ServiceState
-
-    if state == ServiceState.ACTIVE:
-        return ":white_check_mark:"
-    if state == ServiceState.INACTIVE:
-        return ":pause_button:"
-    if state == ServiceState.ERROR:
-        return ":heavy_exclamation_mark:"
-    return ":hourglass_not_done:"
+    return SERVICE_STATE_EMOJIS.get(state, ":hourglass_not_done:")
 
 
 def pretty_print_model_deployer(
@@ -742,14 +770,6 @@ def print_served_model_configuration(
     """
     title_ = f"Properties of Served Model {model_service.uuid}"
 
-    rich_table = table.Table(
-        box=box.HEAVY_EDGE,
-        title=title_,
-        show_lines=True,
-    )
-    rich_table.add_column("MODEL SERVICE PROPERTY", overflow="fold")
-    rich_table.add_column("VALUE", overflow="fold")
-
     # Get implementation specific info
     served_model_info = model_deployer.get_model_server_info(model_service)
 
@@ -764,17 +784,11 @@ def print_served_model_configuration(
     }
 
     # Sort fields alphabetically
-    sorted_items = {k: v for k, v in sorted(served_model_info.items())}
-
-    for item in sorted_items.items():
-        rich_table.add_row(*[str(elem) for elem in item])
-
-    # capitalize entries in first column
-    rich_table.columns[0]._cells = [
-        component.upper()  # type: ignore[union-attr]
-        for component in rich_table.columns[0]._cells
-    ]
-    console.print(rich_table)
+    _print_property_table(
+        properties=sorted(served_model_info.items()),
+        property_column="MODEL SERVICE PROPERTY",
+        title=title_,
+    )
 
 
 def print_server_deployment_list(servers: List["ServerDeployment"]) -> None:
@@ -984,7 +998,7 @@ def _component_display_name(
     return name.replace("_", " ")
 
 
-def get_execution_status_emoji(status: "ExecutionStatus") -> str:
+def get_execution_status_emoji(status: ExecutionStatus) -> str:
     """Returns an emoji representing the given execution status.
 
     Args:
@@ -996,17 +1010,10 @@ def get_execution_status_emoji(status: "ExecutionStatus") -> str:
     Raises:
         RuntimeError: If the given execution status is not supported.
     """
-    from zenml.enums import ExecutionStatus
-
-    if status == ExecutionStatus.FAILED:
-        return ":x:"
-    if status == ExecutionStatus.RUNNING:
-        return ":gear:"
-    if status == ExecutionStatus.COMPLETED:
-        return ":white_check_mark:"
-    if status == ExecutionStatus.CACHED:
-        return ":package:"
-    raise RuntimeError(f"Unknown status: {status}")
+    try:
+        return EXECUTION_STATUS_EMOJIS[status]
+    except KeyError:
+        raise RuntimeError(f"Unknown status: {status}")
 
 
 def print_pipeline_runs_table(
@@ -1293,11 +1300,13 @@ def print_user_info(info: Dict[str, Any]) -> None:
     Args:
         info: The information to print.
     """
-    for key, value in info.items():
-        if key in ["packages", "query_packages"] and not bool(value):
-            continue
-
-        declare(f"{key.upper()}: {value}")
+    lines = [
+        f"{key.upper()}: {value}"
+        for key, value in info.items()
+        if key not in ["packages", "query_packages"] or bool(value)
+    ]
+    # Render all lines with a single console call instead of one per key
+    declare("\n".join(lines))
 
 
 def warn_deprecated_secrets_manager() -> None:
@@ -67,22 +67,10 @@ class EvidentlyColumnMapping(BaseModel):
         column_mapping = ColumnMapping()
 
         # preserve the Evidently defaults where possible
-        column_mapping.target = self.target or column_mapping.target
-        column_mapping.prediction = (
-            self.prediction or column_mapping.prediction
-        )
-        column_mapping.datetime = self.datetime or column_mapping.datetime
-        column_mapping.id = self.id or column_mapping.id
-        column_mapping.numerical_features = (
-            self.numerical_features or column_mapping.numerical_features
-        )
-        column_mapping.datetime_features = (
-            self.datetime_features or column_mapping.datetime_features
-        )
-        column_mapping.target_names = (
-            self.target_names or column_mapping.target_names
-        )
-        column_mapping.task = self.task or column_mapping.task
+        for field_name in self.__fields__:
+            value = getattr(self, field_name)
+            if value:
+                setattr(column_mapping, field_name, value)
 
         return column_mapping
 
@@ -164,16 +152,15 @@ class EvidentlyProfileStep(BaseStep):
                 f"Expects None or list of columns in strings, but got {params.ignored_cols}"
             )
 
-        elif not (
-            set(params.ignored_cols).issubset(set(reference_dataset.columns))
-        ) or not (
-            set(params.ignored_cols).issubset(set(comparison_dataset.columns))
-        ):
-            raise ValueError(
-                "Column is not found in reference or comparison datasets"
-            )
-
         else:
+            ignored_cols = set(params.ignored_cols)
+            if not ignored_cols.issubset(
+                reference_dataset.columns
+            ) or not ignored_cols.issubset(comparison_dataset.columns):
+                raise ValueError(
+                    "Column is not found in reference or comparison datasets"
+                )
+
             reference_dataset = reference_dataset.drop(
                 labels=list(params.ignored_cols), axis=1
             )
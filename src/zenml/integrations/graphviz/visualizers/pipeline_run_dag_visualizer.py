@@ -70,33 +70,41 @@ class PipelineRunDagVisualizer(BaseVisualizer):
 
         dot = graphviz.Digraph(comment=object.name)
 
+        # Edges only connect node IDs, so they are collected and added in a
+        # single call once all nodes are known
+        edges = []
+
         # link the steps together
         for step in object.steps:
+            step_node_id = self.STEP_PREFIX + str(step.id)
             # add each step as a node
             dot.node(
-                self.STEP_PREFIX + str(step.id),
+                step_node_id,
                 step.entrypoint_name,
                 shape=self.STEP_SHAPE,
             )
             # for each parent of a step, add an edge
 
             for artifact_name, artifact in step.outputs.items():
+                artifact_node_id = self.ARTIFACT_PREFIX + str(artifact.id)
                 dot.node(
-                    self.ARTIFACT_PREFIX + str(artifact.id),
+                    artifact_node_id,
                     f"{artifact_name} \n" f"({artifact.data_type})",
                     shape=self.ARTIFACT_SHAPE,
                 )
-                dot.edge(
-                    self.STEP_PREFIX + str(step.id),
-                    self.ARTIFACT_PREFIX + str(artifact.id),
-                )
+                edges.append((step_node_id, artifact_node_id))
 
             for artifact_name, artifact in step.inputs.items():
-                dot.edge(
-                    self.ARTIFACT_PREFIX + str(artifact.id),
-                    self.STEP_PREFIX + str(step.id),
+                edges.append(
+                    (self.ARTIFACT_PREFIX + str(artifact.id), step_node_id)
                 )
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".html") as f:
-            dot.render(filename=f.name, format="png", view=True, cleanup=True)
+        dot.edges(edges)
+
+        # Render in memory and write the image only once, instead of letting
+        # `render` write the DOT source to disk, render it to a second file and
+        # clean up the source afterwards
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as f:
+            f.write(dot.pipe(format="png"))
+        graphviz.view(f.name)
         return dot
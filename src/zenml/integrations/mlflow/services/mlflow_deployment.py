@@ -18,7 +18,6 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 import numpy as np
 import requests
-from mlflow.pyfunc.backend import PyFuncBackend
 from mlflow.version import VERSION as MLFLOW_VERSION
 
 from zenml.constants import DEFAULT_SERVICE_START_STOP_TIMEOUT
@@ -172,6 +171,8 @@ class MLFlowDeploymentService(LocalDaemonService, BaseDeploymentService):
 
         self.endpoint.prepare_for_start()
         try:
+            from mlflow.pyfunc.backend import PyFuncBackend
+
             backend_kwargs: Dict[str, Any] = {}
             serve_kwargs: Dict[str, Any] = {}
             mlflow_version = MLFLOW_VERSION.split(".")
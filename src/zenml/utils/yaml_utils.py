@@ -23,6 +23,13 @@ import yaml
 from zenml.io import fileio
 from zenml.utils import io_utils
 
+try:
+    # Use the libyaml based loader if PyYAML was built with it, it is
+    # considerably faster than the pure Python implementation.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[misc]
+
 
 def write_yaml(
     file_path: str,
@@ -85,7 +92,7 @@ def read_yaml(file_path: str) -> Any:
         contents = io_utils.read_file_contents_as_string(file_path)
         # TODO: [LOW] consider adding a default empty dict to be returned
         #   instead of None
-        return yaml.safe_load(contents)
+        return yaml.load(contents, Loader=_SafeLoader)
     else:
         raise FileNotFoundError(f"{file_path} does not exist.")
 
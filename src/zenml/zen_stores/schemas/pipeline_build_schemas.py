@@ -121,14 +121,13 @@ class PipelineBuildSchema(BaseSchema, table=True):
         Returns:
             The created `PipelineBuildResponseModel`.
         """
+        user, stack, pipeline = self.user, self.stack, self.pipeline
         return PipelineBuildResponseModel(
             id=self.id,
             workspace=self.workspace.to_model(),
-            user=self.user.to_model(True) if self.user else None,
-            stack=self.stack.to_model() if self.stack else None,
-            pipeline=(
-                self.pipeline.to_model(False) if self.pipeline else None
-            ),
+            user=user.to_model(True) if user else None,
+            stack=stack.to_model() if stack else None,
+            pipeline=pipeline.to_model(False) if pipeline else None,
             created=self.created,
             updated=self.updated,
             images=json.loads(self.images),
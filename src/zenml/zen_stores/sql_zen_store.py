@@ -41,7 +41,7 @@ from pydantic import root_validator, validator
 from sqlalchemy import asc, desc, func, text
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import ArgumentError, NoResultFound, OperationalError
-from sqlalchemy.orm import noload
+from sqlalchemy.orm import noload, selectinload
 from sqlmodel import Session, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
@@ -2835,7 +2835,14 @@ class SqlZenStore(BaseZenStore):
             A page of all builds matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(PipelineBuildSchema)
+            # `to_model` resolves all of these for every build, so load them
+            # for the whole page at once instead of one SELECT per row
+            query = select(PipelineBuildSchema).options(
+                selectinload(PipelineBuildSchema.workspace),
+                selectinload(PipelineBuildSchema.user),
+                selectinload(PipelineBuildSchema.stack),
+                selectinload(PipelineBuildSchema.pipeline),
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
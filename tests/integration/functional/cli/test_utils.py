@@ -11,10 +11,20 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import Field, SecretStr
+
+from zenml.cli import utils as cli_utils
 from zenml.cli.utils import (
+    parse_unknown_component_attributes,
+    print_pydantic_models,
     temporary_active_stack,
 )
 from zenml.client import Client
+from zenml.models.base_models import BaseResponseModel
 
 
 def test_temporarily_setting_the_active_stack():
@@ -33,3 +43,40 @@ def test_temporarily_setting_the_active_stack():
         assert Client().active_stack_model == new_stack
 
     assert Client().active_stack_model == initial_stack
+
+
+def test_parse_unknown_component_attributes():
+    """Tests parsing of custom component attributes passed via the CLI."""
+    assert parse_unknown_component_attributes([]) == []
+    assert parse_unknown_component_attributes(["--foo", "--bar_1"]) == [
+        "foo",
+        "bar_1",
+    ]
+
+    for invalid_args in (["foo"], ["-foo"], ["---foo"], ["--foo", "--1bar"]):
+        with pytest.raises(AssertionError):
+            parse_unknown_component_attributes(invalid_args)
+
+
+def test_print_pydantic_models_skips_excluded_fields(mocker):
+    """Tests that fields excluded from serialization are never printed."""
+
+    class ModelWithSecret(BaseResponseModel):
+        name: str
+        password: SecretStr = Field(exclude=True)
+
+    now = datetime.now()
+    model = ModelWithSecret(
+        id=uuid4(),
+        created=now,
+        updated=now,
+        name="aria",
+        password=SecretStr("secret"),
+    )
+    mock_print_table = mocker.patch.object(cli_utils, "print_table")
+
+    print_pydantic_models([model])
+
+    (rows,), _ = mock_print_table.call_args
+    assert list(rows[0]) == list(model.dict())
+    assert "password" not in rows[0]
@@ -0,0 +1,47 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from evidently.pipeline.column_mapping import ColumnMapping
+
+from zenml.integrations.evidently.steps.evidently_profile import (
+    EvidentlyColumnMapping,
+)
+
+
+def test_column_mapping_conversion_copies_set_fields():
+    """Tests that all set fields are copied to the Evidently column mapping."""
+    column_mapping = EvidentlyColumnMapping(
+        target="target",
+        numerical_features=["var_A"],
+        categorical_features=["var_B"],
+        task="classification",
+    ).to_evidently_column_mapping()
+
+    assert column_mapping.target == "target"
+    assert column_mapping.numerical_features == ["var_A"]
+    assert column_mapping.categorical_features == ["var_B"]
+    assert column_mapping.task == "classification"
+
+
+def test_column_mapping_conversion_preserves_evidently_defaults():
+    """Tests that unset fields keep the Evidently column mapping defaults."""
+    default_mapping = ColumnMapping()
+    column_mapping = EvidentlyColumnMapping(
+        target_names=[]
+    ).to_evidently_column_mapping()
+
+    assert column_mapping.target == default_mapping.target
+    assert column_mapping.prediction == default_mapping.prediction
+    assert column_mapping.id == default_mapping.id
+    assert column_mapping.target_names == default_mapping.target_names